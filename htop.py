@@ -5,107 +5,299 @@ import time
 import subprocess
 import os
 import sys
+import socket
+import pwd
+import atexit
+import resource
+import heapq
+import operator
+import math
+import functools
+import signal
 from datetime import datetime
 
-class EnhancedSystemMonitor:
-    def __init__(self, stdscr):
-        self.stdscr = stdscr
-        self.colors = self.init_colors()
-        self.setup_curses()
-        self.process_sort = "cpu"  # Default sort by CPU
-        self.show_details = False  # Toggle detailed view
-
-    def init_colors(self):
-        curses.start_color()
-        curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)
-        curses.init_pair(5, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
-        curses.init_pair(6, curses.COLOR_CYAN, curses.COLOR_BLACK)
-        curses.init_pair(7, curses.COLOR_WHITE, curses.COLOR_BLACK)
-
-        return {
-            'RED': curses.color_pair(1),
-            'GREEN': curses.color_pair(2),
-            'YELLOW': curses.color_pair(3),
-            'BLUE': curses.color_pair(4),
-            'MAGENTA': curses.color_pair(5),
-            'CYAN': curses.color_pair(6),
-            'WHITE': curses.color_pair(7),
-            'RESET': curses.A_NORMAL
-        }
-
-    def setup_curses(self):
-        curses.curs_set(0)
-        self.stdscr.nodelay(1)
-        self.stdscr.timeout(100)
+CLK_TCK = os.sysconf('SC_CLK_TCK')  # Clock ticks per second used by /proc/<pid>/stat
+PAGE_KB = os.sysconf('SC_PAGE_SIZE') // 1024
+BYTE_UNITS = ('KB', 'MB', 'GB', 'TB', 'PB')
+SYNC_BEGIN = b"\x1b[?2026h"  # Synchronized output (DECSET 2026); ignored by terminals without it
+SYNC_END = b"\x1b[?2026l"
+SLOW_INTERVAL = 30  # Seconds between refreshes of slow-moving system info
+# Process row templates; PID and USER are clipped so CPU% always starts at ROW_CPU_COL,
+# but CPU% can outgrow its 5 columns on many-core machines, so MEM% is located per row
+ROW_TPL_BASIC = "{pid:<7.7} {user:<10.10} {cpu:<5.1f} {mem:<5.1f} {comm}"
+ROW_TPL_DETAIL = ("{pid:<7.7} {user:<10.10} {cpu:<5.1f} {mem:<5.1f} "
+                  "{vsz:<8.8} {rss:<8.8} {etime:<10.10} {comm}")
+ROW_CPU_COL = 19
+
+@functools.lru_cache(maxsize=1024)
+def _uid_name(uid):
+    """Resolve a uid to its user name; names don't change during a session"""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
 
-    def run_command(self, cmd):
-        """Execute a command and return its output"""
+class SystemCollector:
+    """Samples system and process information from /proc and /sys, without any display"""
+    def __init__(self):
+        self.show_details = False  # Toggle detailed view
+        self.hostname = socket.gethostname()  # Never changes while running
+        self._info_slow = None  # Uptime, disk and battery, refreshed every SLOW_INTERVAL
+        self._last_slow_refresh = 0.0
+        self._cpu_prev = (0, 0)  # (idle, total) ticks from the last /proc/stat sample
+        # Last process sample as parallel columns, all indexed in step with self.pids
+        self.pids = []
+        self.utime = []
+        self.stime = []
+        self.rss = []  # pages
+        self.vsize = []  # bytes
+        self.starttime = []  # ticks after boot
+        self.stat_bufs = []  # Raw stat lines; comm is only sliced out for displayed rows
+        self._proc_time = 0.0  # time.monotonic() of the last process sample
+        self._stat_fds = {}  # pid -> fd of /proc/<pid>/stat kept open across refreshes
+        # Only keep half the descriptor budget persistent; busier systems reopen the rest
+        self._stat_fd_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0] // 2
+        atexit.register(self.cleanup)
+        self.mem_total_kb = self.read_meminfo().get(b'MemTotal', 0)
+        self.process_count = "N/A"  # Size of the last process sample
+
+    def run_command(self, argv):
+        """Execute a command (an argv list, no shell) and return its output"""
         try:
-            result = subprocess.check_output(cmd, shell=True, text=True, stderr=subprocess.DEVNULL)
-            return result.strip()
+            result = subprocess.run(argv, capture_output=True, text=True, check=True)
+            return result.stdout.strip()
         except (subprocess.CalledProcessError, FileNotFoundError):
             return "N/A"
 
-    def get_system_info(self):
-        """Get system information using basic commands"""
-        hostname = self.run_command("hostname")
-        uptime = self.run_command("uptime -p") or self.run_command("cat /proc/uptime 2>/dev/null | awk '{printf \"%d hrs %d mins\", $1/3600, ($1%3600)/60}'")
-
-        # Get CPU usage
-        cpu_usage = self.run_command("top -bn1 | grep 'Cpu(s)' | awk '{print $2}'")
-        if cpu_usage == "N/A":
-            cpu_usage = self.run_command("mpstat 1 1 | awk '$12 ~ /[0-9.]+/ {printf \"%.1f\", 100 - $12}'")
+    def read_file(self, path):
+        """Read a small file and return its raw bytes, or None if unavailable"""
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def get_cpu_usage(self):
+        """CPU usage since the previous sample, from the aggregate /proc/stat line"""
+        data = self.read_file('/proc/stat')
+        if not data:
+            return "N/A"
 
-        # Get memory info
-        mem_info = self.run_command("free -m | awk 'NR==2{printf \"%.1f/%.1fMB (%.1f%%)\", $3,$2,$3*100/$2}'")
+        # cpu  user nice system idle iowait irq softirq steal ...
+        ticks = [int(v) for v in data.split(b'\n', 1)[0].split()[1:9]]
+        idle = ticks[3] + ticks[4]
+        total = sum(ticks)
+
+        prev_idle, prev_total = self._cpu_prev
+        self._cpu_prev = (idle, total)
+        delta_total = total - prev_total
+        if delta_total <= 0:
+            return "0.0"
+        return f"{(delta_total - (idle - prev_idle)) * 100.0 / delta_total:.1f}"
+
+    def read_meminfo(self):
+        """Parse /proc/meminfo into a dict of kB values keyed by field name"""
+        data = self.read_file('/proc/meminfo')
+        if not data:
+            return {}
+        return {key: int(value.split()[0])
+                for key, value in (line.split(b':', 1) for line in data.splitlines() if b':' in line)}
+
+    def get_mem_info(self):
+        """Memory usage from /proc/meminfo, formatted like `free -m`"""
+        meminfo = self.read_meminfo()
+        total = meminfo.get(b'MemTotal', 0)
+        if not total:
+            return "N/A"
+        available = meminfo.get(b'MemAvailable',
+                                meminfo.get(b'MemFree', 0) + meminfo.get(b'Buffers', 0) + meminfo.get(b'Cached', 0))
+        used = total - available
+        return f"{used / 1024:.1f}/{total / 1024:.1f}MB ({used * 100 / total:.1f}%)"
 
-        # Get disk usage
-        disk_usage = self.run_command("df -h / | awk 'NR==2{printf \"%s/%s (%s)\", $3,$2,$5}'")
+    def get_disk_usage(self, path='/'):
+        """Disk usage of the filesystem holding path, formatted like `df -h`"""
+        try:
+            st = os.statvfs(path)
+        except OSError:
+            return "N/A"
+        total = st.f_blocks * st.f_frsize // 1024
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize // 1024
+        avail = st.f_bavail * st.f_frsize // 1024
+        # df rounds Use% up and measures it against the space unprivileged users can reach
+        pct = -(-used * 100 // (used + avail)) if used + avail else 0
+        return f"{self.format_bytes(used)}/{self.format_bytes(total)} ({pct}%)"
+
+    def _refresh_slow(self):
+        """System info that changes slowly: uptime, disk usage and battery"""
+        # Get uptime
+        uptime = self.read_file('/proc/uptime')
+        if uptime:
+            seconds = float(uptime.split()[0])
+            uptime = f"{int(seconds // 3600)} hrs {int(seconds % 3600 // 60)} mins"
+        else:
+            uptime = "N/A"
 
-        # Get process count
-        process_count = self.run_command("ps -e | wc -l")
+        # Get battery info if available (for laptops)
+        battery = self.read_file('/sys/class/power_supply/BAT0/capacity')
+        battery = f"{battery.decode().strip()}%" if battery else "N/A"
 
-        # Get load average
-        load_avg = self.run_command("cat /proc/loadavg 2>/dev/null | awk '{print $1\", \"$2\", \"$3}'") or "N/A"
-        if load_avg == "N/A":
-            load_avg = self.run_command("uptime | awk -F'load average:' '{print $2}'")
+        return {
+            "uptime": uptime,
+            "disk_usage": self.get_disk_usage(),
+            "battery": battery
+        }
 
-        # Get battery info if available (for laptops)
-        battery = self.run_command("upower -i /org/freedesktop/UPower/devices/battery_BAT0 2>/dev/null | grep percentage | awk '{print $2}'")
-        if battery == "N/A":
-            battery = self.run_command("cat /sys/class/power_supply/BAT0/capacity 2>/dev/null") + "%"
+    def _refresh_fast(self):
+        """System info that is sampled on every refresh"""
+        # Get load average (one libc call, on Linux and macOS alike)
+        try:
+            load_avg = ', '.join(f"{load:.2f}" for load in os.getloadavg())
+        except OSError:
+            load_avg = "N/A"
 
         # Get temperature if available
-        temp = self.run_command("cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null | awk '{printf \"%.1f\", $1/1000}'")
-        if temp != "N/A":
-            temp = f"{temp}°C"
+        temp = self.read_file('/sys/class/thermal/thermal_zone0/temp')
+        try:
+            temp = f"{int(temp) / 1000:.1f}°C"
+        except (TypeError, ValueError):
+            temp = "N/A"
 
         return {
-            "hostname": hostname,
-            "uptime": uptime.replace("up ", "") if uptime != "N/A" else "N/A",
-            "cpu_usage": cpu_usage,
-            "mem_info": mem_info,
-            "disk_usage": disk_usage,
-            "process_count": process_count,
+            "hostname": self.hostname,
+            "cpu_usage": self.get_cpu_usage(),
+            "mem_info": self.get_mem_info(),
+            "process_count": self.process_count,
             "load_avg": load_avg,
-            "battery": battery,
             "temperature": temp
         }
 
+    def get_system_info(self):
+        """Get system information straight from /proc and /sys"""
+        now = time.monotonic()
+        if self._info_slow is None or now - self._last_slow_refresh >= SLOW_INTERVAL:
+            self._info_slow = self._refresh_slow()
+            self._last_slow_refresh = now
+        return {**self._refresh_fast(), **self._info_slow}
+
+    def cleanup(self):
+        """Close all persistent /proc/<pid>/stat descriptors"""
+        for fd in self._stat_fds.values():
+            os.close(fd)
+        self._stat_fds.clear()
+
+    def read_proc_stat(self, pid):
+        """Read /proc/<pid>/stat, reusing the descriptor from earlier refreshes"""
+        fd = self._stat_fds.get(pid)
+        if fd is None:
+            fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+            if len(self._stat_fds) >= self._stat_fd_limit:
+                try:
+                    return os.pread(fd, 4096, 0)
+                finally:
+                    os.close(fd)
+            self._stat_fds[pid] = fd
+
+        try:
+            return os.pread(fd, 4096, 0)
+        except OSError:
+            # The process exited; drop the stale descriptor
+            del self._stat_fds[pid]
+            os.close(fd)
+            raise
+
+    def format_etime(self, seconds):
+        """Format elapsed seconds like ps etime: [[dd-]hh:]mm:ss"""
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        days, hours = divmod(hours, 24)
+        if days:
+            return f"{days}-{hours:02}:{minutes:02}:{seconds:02}"
+        if hours:
+            return f"{hours:02}:{minutes:02}:{seconds:02}"
+        return f"{minutes:02}:{seconds:02}"
+
+    def collect_procs(self):
+        """Collect the busiest processes by reading /proc/<pid>/stat directly"""
+        pids = [int(entry.name) for entry in os.scandir('/proc') if entry.name.isdigit()]
+        for pid in self._stat_fds.keys() - set(pids):
+            os.close(self._stat_fds.pop(pid))
+
+        # Process start times count from boot; CLOCK_BOOTTIME is served by the
+        # vDSO, so this costs no syscall, unlike re-reading /proc/uptime
+        now = time.monotonic()
+        uptime_ticks = time.clock_gettime(time.CLOCK_BOOTTIME) * CLK_TCK
+        interval_ticks = max((now - self._proc_time) * CLK_TCK, 1)
+        prev_ticks = dict(zip(self.pids, map(operator.add, self.utime, self.stime)))
+
+        sampled, utime, stime, rss, vsize, starttime, stat_bufs = [], [], [], [], [], [], []
+        for pid in pids:
+            try:
+                buf = self.read_proc_stat(pid)
+            except OSError:
+                continue  # Process exited while scanning
+
+            # comm may itself contain spaces and parens, but everything after the
+            # last ')' is at a fixed position; split only as far as rss
+            fields = buf[buf.rindex(b')') + 2:].split(None, 22)
+            sampled.append(pid)
+            utime.append(int(fields[11]))
+            stime.append(int(fields[12]))
+            starttime.append(int(fields[19]))
+            vsize.append(int(fields[20]))
+            rss.append(int(fields[21]))
+            stat_bufs.append(buf)
+
+        self.pids, self.utime, self.stime = sampled, utime, stime
+        self.rss, self.vsize, self.starttime, self.stat_bufs = rss, vsize, starttime, stat_bufs
+        self.process_count = str(len(sampled))
+        self._proc_time = now
+
+        # %CPU over the last interval; on first sighting, the lifetime average like ps
+        scale = 100.0 / interval_ticks
+        cpu_pct = [(ticks - prev_ticks[pid]) * scale if pid in prev_ticks
+                   else ticks * 100.0 / max(uptime_ticks - start, 1)
+                   for pid, ticks, start in zip(sampled, map(operator.add, utime, stime), starttime)]
+
+        # Only the rows that will be displayed are turned into dicts
+        processes = []
+        for i in heapq.nlargest(30, range(len(sampled)), key=cpu_pct.__getitem__):
+            pid = sampled[i]
+            try:
+                uid = os.stat(f"/proc/{pid}").st_uid
+            except OSError:
+                continue
+            rss_kb = rss[i] * PAGE_KB
+            buf = stat_bufs[i]
+            processes.append({
+                "pid": str(pid),
+                "user": _uid_name(uid),
+                "cpu": cpu_pct[i],
+                "mem": rss_kb * 100.0 / self.mem_total_kb if self.mem_total_kb else 0.0,
+                "vsz": vsize[i] // 1024,
+                "rss": rss_kb,
+                "etime": self.format_etime((uptime_ticks - starttime[i]) / CLK_TCK),
+                "comm": buf[buf.index(b'(') + 1:buf.rindex(b')')].decode(errors='replace')
+            })
+
+        return processes
+
     def get_processes(self):
         """Get process information with more details"""
+        try:
+            return self.collect_procs()
+        except OSError:
+            pass  # No usable /proc (e.g. macOS), fall back to ps
+
         processes = []
         try:
             # Get more processes (up to 30)
             if self.show_details:
-                output = self.run_command("ps -eo pid,user,%cpu,%mem,vsz,rss,etime,comm --sort=-%cpu | head -n 31")
+                output = self.run_command(["ps", "-eo", "pid,user,%cpu,%mem,vsz,rss,etime,comm", "--sort=-%cpu"])
             else:
-                output = self.run_command("ps -eo pid,user,%cpu,%mem,comm --sort=-%cpu | head -n 31")
+                output = self.run_command(["ps", "-eo", "pid,user,%cpu,%mem,comm", "--sort=-%cpu"])
+            self.process_count = str(len(output.splitlines()) - 1) if output != "N/A" else "N/A"
 
-            for line in output.split('\n')[1:]:  # Skip header
+            for line in output.splitlines()[1:31]:  # Skip header
                 if line.strip():
                     if self.show_details:
                         parts = line.split(maxsplit=7)
@@ -113,10 +305,10 @@ class EnhancedSystemMonitor:
                             processes.append({
                                 "pid": parts[0],
                                 "user": parts[1],
-                                "cpu": parts[2],
-                                "mem": parts[3],
-                                "vsz": parts[4],
-                                "rss": parts[5],
+                                "cpu": float(parts[2]),
+                                "mem": float(parts[3]),
+                                "vsz": int(parts[4]),
+                                "rss": int(parts[5]),
                                 "etime": parts[6],
                                 "comm": parts[7]
                             })
@@ -126,23 +318,24 @@ class EnhancedSystemMonitor:
                             processes.append({
                                 "pid": parts[0],
                                 "user": parts[1],
-                                "cpu": parts[2],
-                                "mem": parts[3],
+                                "cpu": float(parts[2]),
+                                "mem": float(parts[3]),
                                 "comm": parts[4]
                             })
         except Exception as e:
             # Fallback to simpler command if the detailed one fails
             try:
-                output = self.run_command("ps -eo pid,user,%cpu,%mem,comm --sort=-%cpu | head -n 31")
-                for line in output.split('\n')[1:]:
+                output = self.run_command(["ps", "-eo", "pid,user,%cpu,%mem,comm", "--sort=-%cpu"])
+                self.process_count = str(len(output.splitlines()) - 1) if output != "N/A" else "N/A"
+                for line in output.splitlines()[1:31]:
                     if line.strip():
                         parts = line.split(maxsplit=4)
                         if len(parts) >= 5:
                             processes.append({
                                 "pid": parts[0],
                                 "user": parts[1],
-                                "cpu": parts[2],
-                                "mem": parts[3],
+                                "cpu": float(parts[2]),
+                                "mem": float(parts[3]),
                                 "comm": parts[4]
                             })
             except:
@@ -151,182 +344,295 @@ class EnhancedSystemMonitor:
         return processes
 
     def format_bytes(self, kb):
-        """Format kilobytes to human readable format"""
-        if kb == "N/A" or not str(kb).isdigit():
-            return "N/A"
+        """Format an integer number of kilobytes to human readable format"""
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        idx = min(max(kb.bit_length() - 1, 0) // 10, len(BYTE_UNITS) - 1)
+        return f"{kb / (1 << (idx * 10)):.1f} {BYTE_UNITS[idx]}"
 
-        try:
-            kb_val = int(kb)
-            for unit in ['KB', 'MB', 'GB', 'TB']:
-                if kb_val < 1024.0:
-                    return f"{kb_val:.1f} {unit}"
-                kb_val /= 1024.0
-            return f"{kb_val:.1f} PB"
-        except:
-            return "N/A"
+class EnhancedSystemMonitor(SystemCollector):
+    def __init__(self, stdscr):
+        super().__init__()
+        self.stdscr = stdscr
+        self.colors = self.init_colors()
+        self.setup_curses()
+        self.process_sort = "cpu"  # Default sort by CPU
+        self._fmt_row = None  # Row formatter specialized for _fmt_key
+        self._fmt_key = None  # (width, show_details) the row formatter was built for
+        # Screen size, re-read only after SIGWINCH rather than on every frame
+        self.h, self.w = self.stdscr.getmaxyx()
+        self._size_dirty = False
+        signal.signal(signal.SIGWINCH, self._on_resize)
+        self._last_lines = {}  # row -> segments drawn there in the previous frame
+        self._last_rows = []  # (text, cpu level, mem level) of each process row in the previous frame
+
+    def init_colors(self):
+        curses.start_color()
+        curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)
+        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
+        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+        curses.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)
+        curses.init_pair(5, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
+        curses.init_pair(6, curses.COLOR_CYAN, curses.COLOR_BLACK)
+        curses.init_pair(7, curses.COLOR_WHITE, curses.COLOR_BLACK)
+
+        # Bound as attributes too, so drawing code avoids a dict lookup per cell
+        self.C_RED = curses.color_pair(1)
+        self.C_GREEN = curses.color_pair(2)
+        self.C_YELLOW = curses.color_pair(3)
+        self.C_BLUE = curses.color_pair(4)
+        self.C_MAGENTA = curses.color_pair(5)
+        self.C_CYAN = curses.color_pair(6)
+        self.C_WHITE = curses.color_pair(7)
+        # Indexed by usage_levels(): normal, warning, critical
+        self._usage_palette = (self.C_GREEN, self.C_YELLOW, self.C_RED)
+
+        return {
+            'RED': self.C_RED,
+            'GREEN': self.C_GREEN,
+            'YELLOW': self.C_YELLOW,
+            'BLUE': self.C_BLUE,
+            'MAGENTA': self.C_MAGENTA,
+            'CYAN': self.C_CYAN,
+            'WHITE': self.C_WHITE,
+            'RESET': curses.A_NORMAL
+        }
+
+    def setup_curses(self):
+        curses.curs_set(0)
+
+    def _on_resize(self, signum, frame):
+        self._size_dirty = True
+
+    def update_size(self):
+        """Pick up a new terminal size after SIGWINCH and start from a blank screen"""
+        self._size_dirty = False
+        # This handler replaces curses' own, so tell curses about the new size ourselves
+        columns, lines = os.get_terminal_size(sys.stdout.fileno())
+        curses.resizeterm(lines, columns)
+        self.h, self.w = self.stdscr.getmaxyx()
+        self.stdscr.erase()
+        self._last_lines.clear()
+        self._last_rows.clear()
+
+    def draw_line(self, row, *segments):
+        """Draw (col, text, attr) segments on row, skipping rows unchanged since the last frame"""
+        if row >= self.h or self._last_lines.get(row) == segments:
+            return
+        self._last_lines[row] = segments
+        self.stdscr.move(row, 0)
+        self.stdscr.clrtoeol()
+        # Clip to the screen so a long line never wraps into the row below
+        for col, text, attr in segments:
+            if col < self.w - 1:
+                self.stdscr.addstr(row, col, text[:self.w - 1 - col], attr)
+
+    def draw_colored_line(self, row, text, attr, *spans):
+        """Draw text on row in one call, then recolor (col, length, attr) spans in place"""
+        self._last_lines.pop(row, None)
+        self.stdscr.move(row, 0)
+        self.stdscr.clrtoeol()
+        # Clip to the screen so a long row never wraps into the row below
+        self.stdscr.addstr(row, 0, text[:max(self.w - 1, 0)], attr)
+        for col, length, span_attr in spans:
+            if col < self.w - 1:
+                self.stdscr.chgat(row, col, min(length, self.w - 1 - col), span_attr)
+
+    def flush_frame(self):
+        """Send the pending frame to the terminal as one synchronized update"""
+        self.stdscr.noutrefresh()
+        # curses only writes to the terminal inside doupdate(), and flushes before returning
+        fd = sys.stdout.fileno()
+        os.write(fd, SYNC_BEGIN)
+        curses.doupdate()
+        os.write(fd, SYNC_END)
+
+    def clear_below(self, row):
+        """Blank everything from row to the bottom of the screen"""
+        height, width = self.h, self.w
+        if row < height:
+            self.stdscr.move(row, 0)
+            self.stdscr.clrtobot()
+        for stale in [r for r in self._last_lines if r >= row]:
+            del self._last_lines[stale]
 
     def display_header(self, info):
         """Display system header information"""
-        height, width = self.stdscr.getmaxyx()
+        height, width = self.h, self.w
+        separator = (0, "=" * (width-1), self.C_WHITE)
 
         # Header
-        self.stdscr.addstr(0, 0, "=" * (width-1), self.colors['WHITE'])
         title = "Enhanced System Monitor"
         host_info = f"Host: {info['hostname']}"
-        self.stdscr.addstr(1, 0, title, self.colors['CYAN'] | curses.A_BOLD)
-        self.stdscr.addstr(1, len(title) + 2, host_info, self.colors['GREEN'])
-        self.stdscr.addstr(2, 0, "=" * (width-1), self.colors['WHITE'])
+        self.draw_line(0, separator)
+        self.draw_line(1, (0, title, self.C_CYAN | curses.A_BOLD),
+                       (len(title) + 2, host_info, self.C_GREEN))
+        self.draw_line(2, separator)
 
         # System info line 1
         uptime_info = f"Uptime: {info['uptime']}"
         load_info = f"Load: {info['load_avg']}"
-        self.stdscr.addstr(3, 0, uptime_info, self.colors['YELLOW'])
-        self.stdscr.addstr(3, len(uptime_info) + 2, load_info, self.colors['MAGENTA'])
+        self.draw_line(3, (0, uptime_info, self.C_YELLOW),
+                       (len(uptime_info) + 2, load_info, self.C_MAGENTA))
 
         # System info line 2
         processes_info = f"Processes: {info['process_count']}"
         cpu_info = f"CPU: {info['cpu_usage']}"
         mem_info = f"Memory: {info['mem_info']}"
-        self.stdscr.addstr(4, 0, processes_info, self.colors['GREEN'])
-        self.stdscr.addstr(4, len(processes_info) + 2, cpu_info, self.colors['RED'])
-        self.stdscr.addstr(4, len(processes_info) + len(cpu_info) + 4, mem_info, self.colors['BLUE'])
+        self.draw_line(4, (0, processes_info, self.C_GREEN),
+                       (len(processes_info) + 2, cpu_info, self.C_RED),
+                       (len(processes_info) + len(cpu_info) + 4, mem_info, self.C_BLUE))
 
         # System info line 3
         disk_info = f"Disk: {info['disk_usage']}"
         battery_info = f"Battery: {info['battery']}" if info['battery'] != "N/A" else ""
         temp_info = f"Temp: {info['temperature']}" if info['temperature'] != "N/A" else ""
 
-        self.stdscr.addstr(5, 0, disk_info, self.colors['CYAN'])
+        segments = [(0, disk_info, self.C_CYAN)]
         pos = len(disk_info) + 2
         if battery_info:
-            self.stdscr.addstr(5, pos, battery_info, self.colors['GREEN'])
+            segments.append((pos, battery_info, self.C_GREEN))
             pos += len(battery_info) + 2
         if temp_info:
-            self.stdscr.addstr(5, pos, temp_info, self.colors['YELLOW'])
-
-        self.stdscr.addstr(6, 0, "=" * (width-1), self.colors['WHITE'])
+            segments.append((pos, temp_info, self.C_YELLOW))
+        self.draw_line(5, *segments)
+
+        self.draw_line(6, separator)
+
+    def build_row_formatter(self, width):
+        """Build a row formatter with the COMMAND truncation for this width baked in"""
+        template = ROW_TPL_DETAIL if self.show_details else ROW_TPL_BASIC
+        # Every column before COMMAND is fixed width, so blank fields give its start column
+        comm_col = len(template.format(pid='', user='', cpu=0.0, mem=0.0, vsz='', rss='', etime='', comm=''))
+        fmt = template.replace("{comm}", f"{{comm:.{max(width - 1 - comm_col, 0)}}}").format_map
+        if comm_col > width - 1:
+            # Too narrow for even the fixed columns
+            return lambda fields: fmt(fields)[:width - 1]
+        return fmt
+
+    def usage_levels(self, values, warn, crit):
+        """Classify usage percentages as 0 (normal), 1 (above warn) or 2 (above crit)"""
+        return [(value > warn) + (value > crit) for value in values]
 
     def display_processes(self, processes, start_row):
         """Display process information with more details"""
-        height, width = self.stdscr.getmaxyx()
+        height, width = self.h, self.w
 
         # Process table header
         if self.show_details:
-            header = f"{'PID':<6} {'USER':<10} {'CPU%':<5} {'MEM%':<5} {'VSZ':<8} {'RSS':<8} {'TIME':<10} {'COMMAND'}"
+            header = f"{'PID':<7} {'USER':<10} {'CPU%':<5} {'MEM%':<5} {'VSZ':<8} {'RSS':<8} {'TIME':<10} {'COMMAND'}"
         else:
-            header = f"{'PID':<6} {'USER':<10} {'CPU%':<5} {'MEM%':<5} {'COMMAND'}"
+            header = f"{'PID':<7} {'USER':<10} {'CPU%':<5} {'MEM%':<5} {'COMMAND'}"
 
-        self.stdscr.addstr(start_row, 0, header, self.colors['WHITE'] | curses.A_BOLD)
-        self.stdscr.addstr(start_row + 1, 0, "=" * (width-1), self.colors['WHITE'])
+        self.draw_line(start_row, (0, header, self.C_WHITE | curses.A_BOLD))
+        self.draw_line(start_row + 1, (0, "=" * (width-1), self.C_WHITE))
 
         # Process rows
-        max_processes = height - start_row - 4  # Leave space for footer
-        for i, proc in enumerate(processes[:max_processes]):
+        max_processes = max(0, height - start_row - 4)  # Leave space for footer
+        shown = processes[:max_processes]
+
+        # Determine colors based on usage, for the whole table at once
+        palette = self._usage_palette
+        cpu_levels = self.usage_levels([proc['cpu'] for proc in shown], 10, 20)
+        mem_levels = self.usage_levels([proc['mem'] for proc in shown], 2, 5)
+
+        # The formatter only changes on resize or when toggling the detailed view
+        if self._fmt_key != (width, self.show_details):
+            self._fmt_key = (width, self.show_details)
+            self._fmt_row = self.build_row_formatter(width)
+            self._last_rows.clear()
+        fmt_row = self._fmt_row
+        last_rows = self._last_rows
+
+        for i, proc in enumerate(shown):
             row = start_row + 2 + i
             if row >= height - 2:  # Leave space for footer
                 break
 
-            # Determine colors based on usage
-            cpu_color = self.colors['GREEN']
-            try:
-                if float(proc['cpu']) > 20:
-                    cpu_color = self.colors['RED']
-                elif float(proc['cpu']) > 10:
-                    cpu_color = self.colors['YELLOW']
-            except:
-                pass
-
-            mem_color = self.colors['GREEN']
-            try:
-                if float(proc['mem']) > 5:
-                    mem_color = self.colors['RED']
-                elif float(proc['mem']) > 2:
-                    mem_color = self.colors['YELLOW']
-            except:
-                pass
-
             # Format process line
-            pid_str = f"{proc['pid']:<6}"
-            user_str = f"{proc['user']:<10}"[:10]
-            cpu_str = f"{proc['cpu']:<5}"
-            mem_str = f"{proc['mem']:<5}"
-
             if self.show_details:
-                vsz_str = f"{self.format_bytes(proc['vsz']):<8}"[:8]
-                rss_str = f"{self.format_bytes(proc['rss']):<8}"[:8]
-                etime_str = f"{proc['etime']:<10}"[:10]
-                comm_str = proc['comm'][:width-55] if width > 55 else proc['comm'][:20]
-
-                # Add to screen with colors
-                self.stdscr.addstr(row, 0, pid_str, self.colors['WHITE'])
-                self.stdscr.addstr(row, 6, user_str, self.colors['CYAN'])
-                self.stdscr.addstr(row, 16, cpu_str, cpu_color)
-                self.stdscr.addstr(row, 21, mem_str, mem_color)
-                self.stdscr.addstr(row, 26, vsz_str, self.colors['BLUE'])
-                self.stdscr.addstr(row, 34, rss_str, self.colors['MAGENTA'])
-                self.stdscr.addstr(row, 42, etime_str, self.colors['YELLOW'])
-                self.stdscr.addstr(row, 52, comm_str, self.colors['GREEN'])
+                line = fmt_row(dict(proc, vsz=self.format_bytes(proc['vsz']), rss=self.format_bytes(proc['rss'])))
+            else:
+                line = fmt_row(proc)
+
+            # Most rows on an idle system are identical to the last frame; leave those alone
+            drawn = (line, cpu_levels[i], mem_levels[i])
+            if i < len(last_rows):
+                if last_rows[i] == drawn:
+                    continue
+                last_rows[i] = drawn
             else:
-                comm_str = proc['comm'][:width-30] if width > 30 else proc['comm'][:20]
+                last_rows.append(drawn)
+
+            cpu_width = max(5, len(f"{proc['cpu']:.1f}"))
+            mem_col = ROW_CPU_COL + cpu_width + 1
+            self.draw_colored_line(row, line, self.C_WHITE,
+                                   (ROW_CPU_COL, cpu_width, palette[cpu_levels[i]]),
+                                   (mem_col, 5, palette[mem_levels[i]]))
 
-                # Add to screen with colors
-                self.stdscr.addstr(row, 0, pid_str, self.colors['WHITE'])
-                self.stdscr.addstr(row, 6, user_str, self.colors['CYAN'])
-                self.stdscr.addstr(row, 16, cpu_str, cpu_color)
-                self.stdscr.addstr(row, 21, mem_str, mem_color)
-                self.stdscr.addstr(row, 26, comm_str, self.colors['GREEN'])
+        # Rows past the end of a shorter table get overwritten by the gap and footer below
+        del last_rows[len(shown):]
+        if start_row + 2 + len(shown) < height:
+            self.draw_line(start_row + 2 + len(shown))
 
         return start_row + 2 + min(len(processes), max_processes) + 1
 
     def display_footer(self, row):
         """Display footer information"""
-        height, width = self.stdscr.getmaxyx()
+        height, width = self.h, self.w
 
         if row < height - 1:
-            self.stdscr.addstr(row, 0, "=" * (width-1), self.colors['WHITE'])
+            self.draw_line(row, (0, "=" * (width-1), self.C_WHITE))
 
             # Help text
             mode = "Detailed" if self.show_details else "Basic"
             help_text = f"Mode: {mode} | [D]etails [Q]uit"
-            self.stdscr.addstr(row + 1, 0, help_text, self.colors['GREEN'])
+            self.draw_line(row + 1, (0, help_text, self.C_GREEN))
+            row += 2
+
+        # Rows left over from a taller previous frame
+        self.clear_below(row)
 
     def run(self):
         """Main monitoring loop"""
-        last_update = 0
         update_interval = 2  # seconds
+        last_update = time.monotonic() - update_interval
 
-        while True:
-            # Check for user input
-            key = self.stdscr.getch()
-            if key == ord('q') or key == ord('Q'):
-                break
-            elif key == ord('d') or key == ord('D'):
-                self.show_details = not self.show_details
-
-            current_time = time.time()
-            if current_time - last_update >= update_interval:
-                # Clear screen
-                self.stdscr.clear()
-
-                # Get all system information
-                info = self.get_system_info()
-                processes = self.get_processes()
-
-                # Display all information
-                self.display_header(info)
-
-                # Display processes
-                row = self.display_processes(processes, 7)
-
-                # Display footer
-                self.display_footer(row)
-
-                # Refresh screen
-                self.stdscr.refresh()
-                last_update = current_time
-
-            # Small delay to prevent high CPU usage
-            time.sleep(0.1)
+        try:
+            while True:
+                # Sleep in getch() until a key arrives or the next refresh is due
+                wait_ms = max(0, math.ceil((last_update + update_interval - time.monotonic()) * 1000))
+                self.stdscr.timeout(wait_ms)
+                key = self.stdscr.getch()
+                if key == ord('q') or key == ord('Q'):
+                    break
+                elif key == ord('d') or key == ord('D'):
+                    self.show_details = not self.show_details
+
+                current_time = time.monotonic()
+                if self._size_dirty or current_time - last_update >= update_interval:
+                    # Start from a blank screen only when the terminal was resized;
+                    # otherwise rows are overwritten in place and curses sends just the changes
+                    if self._size_dirty:
+                        self.update_size()
+
+                    # Get all system information
+                    processes = self.get_processes()
+                    info = self.get_system_info()
+
+                    # Display all information
+                    self.display_header(info)
+
+                    # Display processes
+                    row = self.display_processes(processes, 7)
+
+                    # Display footer
+                    self.display_footer(row)
+
+                    # Refresh screen
+                    self.flush_frame()
+                    last_update = current_time
+        finally:
+            self.cleanup()
 
 def main(stdscr):
     monitor = EnhancedSystemMonitor(stdscr)
@@ -341,28 +647,27 @@ if __name__ == "__main__":
         print(f"Error: {e}")
         print("Falling back to text mode...")
 
-        # Fallback to simple text mode
+        # Fallback to simple text mode, reading /proc the same way as the curses view
+        collector = SystemCollector()
         while True:
-            os.system('clear')
-            print("Enhanced System Monitor (Text Mode)")
-            print("===================================")
-
-            # Get system info with subprocess
+            lines = ["Enhanced System Monitor (Text Mode)",
+                     "==================================="]
             try:
-                hostname = subprocess.check_output("hostname", shell=True, text=True).strip()
-                uptime = subprocess.check_output("uptime -p", shell=True, text=True).strip().replace("up ", "")
-                cpu_usage = subprocess.check_output("top -bn1 | grep 'Cpu(s)' | awk '{print $2}'", shell=True, text=True).strip()
-                mem_info = subprocess.check_output("free -m | awk 'NR==2{printf \"%.1f/%.1fMB (%.1f%%)\", $3,$2,$3*100/$2}'", shell=True, text=True).strip()
-                processes = subprocess.check_output("ps -eo pid,user,%cpu,%mem,comm --sort=-%cpu | head -n 30", shell=True, text=True).strip()
-
-                print(f"Host: {hostname}")
-                print(f"Uptime: {uptime}")
-                print(f"CPU: {cpu_usage}%")
-                print(f"Memory: {mem_info}")
-                print("\nTop processes by CPU:")
-                print(processes)
-                print("\nPress Ctrl+C to exit")
+                processes = collector.get_processes()
+                info = collector.get_system_info()
+
+                lines.append(f"Host: {info['hostname']}")
+                lines.append(f"Uptime: {info['uptime']}")
+                lines.append(f"CPU: {info['cpu_usage']}%")
+                lines.append(f"Memory: {info['mem_info']}")
+                lines.append("\nTop processes by CPU:")
+                lines.append(f"{'PID':<7} {'USER':<10} {'CPU%':<5} {'MEM%':<5} {'COMMAND'}")
+                lines.extend(ROW_TPL_BASIC.format_map(proc) for proc in processes)
+                lines.append("\nPress Ctrl+C to exit")
             except Exception as e:
-                print(f"Error getting system information: {e}")
+                lines.append(f"Error getting system information: {e}")
 
+            # Clear the screen with an escape sequence rather than forking `clear`
+            sys.stdout.write("\x1b[2J\x1b[H" + "\n".join(lines) + "\n")
+            sys.stdout.flush()
             time.sleep(2)